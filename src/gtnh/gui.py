@@ -1,32 +1,53 @@
 import logging
 import os
+import posixpath
+import sys
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
-from shutil import copy, rmtree
+from queue import Empty, Queue
+from threading import Event, Thread
 from tkinter.messagebox import showerror, showinfo, showwarning
 from tkinter.ttk import Progressbar
-from typing import Any, Callable, List, Optional, Tuple
-from zipfile import ZipFile
+from typing import IO, Any, Callable, List, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
-import requests
 from github import Github
 from github.Organization import Organization
 
 from gtnh.add_mod import get_repo, new_mod_from_repo
 from gtnh.exceptions import LatestReleaseNotFound, PackingInterruptException, RepoNotFoundException
-from gtnh.mod_info import GTNHModpack
-from gtnh.pack_downloader import download_mod, ensure_cache_dir
+from gtnh.mod_info import GTNHModpack, ModInfo
+from gtnh.pack_downloader import DOWNLOAD_CHUNK_SIZE, MAX_CONNECTIONS, download_mod, ensure_cache_dir, get_session
 from gtnh.utils import get_latest_release, get_token, load_gtnh_manifest, sort_and_write_modpack
 
 log = logging.getLogger("gui")
 log.setLevel(logging.WARNING)
 
+# number of mods downloaded at the same time, matching the connections pooled by the download session
+MAX_DOWNLOAD_WORKERS = MAX_CONNECTIONS
+
+# size in bytes of the chunks used to copy the files between archives
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# deflate level used for the files packed in the archives
+COMPRESS_LEVEL = 5
+
+# max number of times per second the progress of the packing is redrawn
+REDRAW_RATE = 30
+
+# suffixes of the files that are already zip archives, which are stored as is instead of being compressed again
+STORED_SUFFIXES = [".jar", ".zip"]
+
 
 def download_mods(
     gtnh_modpack: GTNHModpack,
     github: Github,
     organization: Organization,
     callback: Optional[Callable[[float, str], None]] = None,
+    on_download: Optional[Callable[[ModInfo, List[Path]], None]] = None,
 ) -> Tuple[List[Path], List[Path]]:
     """
     method to download all the mods required for the pack.
@@ -36,120 +57,168 @@ def download_mods(
     :param organization: Organization object. Represent the GTNH organization.
     :param callback: Callable that takes a float and a string in parameters. (mainly the method to update the
                 progress bar that takes a progress step per call and the label used to display infos to the user)
+    :param on_download: Callable that takes a ModInfo and a list of Path in parameters. It is called with the paths of
+                        each mod as soon as the mod is downloaded.
     :return: a list holding all the paths to the clientside mods and a list holding all the paths to the serverside
             mod.
     """
     # computation of the progress per mod for the progressbar
     delta_progress = 100 / len(gtnh_modpack.github_mods)
 
-    # lists holding the paths to the mods
-    client_paths = []
-    server_paths = []
+    # download of the mods, fanned out on a thread pool as the downloads are network bound
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        futures = [executor.submit(download_mod, github, organization, mod) for mod in gtnh_modpack.github_mods]
+        mods_by_future = dict(zip(futures, gtnh_modpack.github_mods))
 
-    # download of the mods
-    for mod in gtnh_modpack.github_mods:
-        if callback is not None:
-            callback(delta_progress, f"downloading mods. current mod: {mod.name} Progress: {{0}}%")
-
-        # do the actual work
-        paths = download_mod(github, organization, mod)
-        if mod.side == "BOTH":
-            client_paths.extend(paths)
-            server_paths.extend(paths)
-        elif mod.side == "CLIENT":
-            client_paths.extend(paths)
-        elif mod.side == "SERVER":
-            server_paths.extend(paths)
+        # the callbacks are called from this thread as tkinter isn't thread safe
+        try:
+            for future in as_completed(futures):
+                paths = future.result()
+                if callback is not None:
+                    callback(delta_progress, f"downloading mods. last downloaded mod: {mods_by_future[future].name} Progress: {{0}}%")
+
+                if on_download is not None:
+                    on_download(mods_by_future[future], paths)
+
+        # dropping the downloads not started yet, so the error isn't held back until they are all done
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    # lists holding the paths to the mods, in the order of the modpack to keep them deterministic
+    paths_by_mod = [(mod, future.result()) for mod, future in zip(gtnh_modpack.github_mods, futures)]
+    client_paths = list(chain.from_iterable(paths for mod, paths in paths_by_mod if mod.side in ["BOTH", "CLIENT"]))
+    server_paths = list(chain.from_iterable(paths for mod, paths in paths_by_mod if mod.side in ["BOTH", "SERVER"]))
 
     # todo: make a similar thing for the curse mods
 
     return client_paths, server_paths
 
 
-def pack_clientpack(client_paths: List[Path], pack_version: str, callback: Optional[Callable[[float, str], None]] = None) -> None:
+def get_compress_type(path: Path) -> int:
+    """
+    Method used to get the compression method of a file in the archives.
+
+    :param path: the path of the file.
+    :return: ZIP_STORED for the files that are already compressed, ZIP_DEFLATED otherwise.
+    """
+    return ZIP_STORED if path.suffix.lower() in STORED_SUFFIXES else ZIP_DEFLATED
+
+
+def get_partial_archive_path(archive_name: str) -> Path:
+    """
+    Method used to get the path an archive is written to while it is being packed.
+
+    :param archive_name: the name of the archive.
+    :return: the path of the partial archive in the cache folder.
+    """
+    return ensure_cache_dir() / f"{archive_name}.part"
+
+
+def open_archive(archive_name: str) -> ZipFile:
+    """
+    Method used to open a new archive in the cache folder. The archive is written under a partial name, until it is
+    published with publish_archive once the packing succeeded.
+
+    :param archive_name: the name of the archive.
+    :return: the ZipFile object of the archive, opened in write mode.
+    """
+    # entries are deflated unless stated otherwise, and zip64 is allowed upfront as the archives can outgrow 4 GB
+    archive = ZipFile(
+        get_partial_archive_path(archive_name), "w", compression=ZIP_DEFLATED, allowZip64=True, compresslevel=COMPRESS_LEVEL, strict_timestamps=False
+    )
+
+    return archive
+
+
+def publish_archive(archive_name: str) -> None:
+    """
+    Method used to give a packed archive its final name, replacing any previous archive with the same name.
+
+    :param archive_name: the name of the archive.
+    :return: None
+    """
+    os.replace(get_partial_archive_path(archive_name), ensure_cache_dir() / archive_name)
+
+
+def discard_archive(archive_name: str) -> None:
+    """
+    Method used to delete an archive whose packing failed, so no incomplete archive is left behind.
+
+    :param archive_name: the name of the archive.
+    :return: None
     """
-    Method used to pack all the client files into a client archive.
+    partial_archive_path = get_partial_archive_path(archive_name)
+    if partial_archive_path.exists():
+        os.remove(partial_archive_path)
+        log.info(f"partial archive {archive_name} deleted")
+
 
+def pack_clientpack(
+    client_archive: ZipFile,
+    client_paths: List[Path],
+    source_root: Path,
+    pack_version: str,
+    callback: Optional[Callable[[float, str], None]] = None,
+) -> None:
+    """
+    Method used to pack client files into the client archive.
+
+    :param client_archive: the client archive, opened in write mode.
     :param client_paths: a list containing all the Path objects refering to the files needed client side.
+    :param source_root: the root folder of the files. Their path in the archive is relative to it.
     :param pack_version: the version of the pack.
     :param callback: Callable that takes a float and a string in parameters. (mainly the method to update the
             progress bar that takes a progress step per call and the label used to display infos to the user)
     :return: None
     """
+    if not client_paths:
+        return
 
     # computation of the progress per mod for the progressbar
     delta_progress = 100 / len(client_paths)
 
-    # remembering the cwd because it'll be changed during the zip operation
-    cwd = os.getcwd()
-    cache_dir = Path(ensure_cache_dir())
-    os.chdir(cache_dir)
-
-    # archive name
-    archive_name = f"client-{pack_version}.zip"
-
-    # deleting any previous client archive
-    if os.path.exists(archive_name):
-        os.remove(archive_name)
-        log.info("previous client archive deleted")
-
-    log.info("zipping client archive")
     # zipping the files in the archive
-    with ZipFile(archive_name, "w") as client_archive:
-        for mod_path in client_paths:
-            if callback is not None:
-                callback(delta_progress, f"Packing client archive version {pack_version}: {mod_path.name}. Progress: {{0}}%")
-
-            # writing the file in the zip
-            client_archive.write(mod_path, mod_path.relative_to(cache_dir / "client_archive"))
-
-    log.info("success!")
+    for mod_path in client_paths:
+        if callback is not None:
+            callback(delta_progress, f"Packing client archive version {pack_version}: {mod_path.name}. Progress: {{0}}%")
 
-    # restoring the cwd
-    os.chdir(cwd)
+        # writing the file in the zip
+        client_archive.write(mod_path, mod_path.relative_to(source_root), compress_type=get_compress_type(mod_path))
 
 
-def pack_serverpack(server_paths: List[Path], pack_version: str, callback: Optional[Callable[[float, str], None]] = None) -> None:
+def pack_serverpack(
+    server_archive: ZipFile,
+    server_paths: List[Path],
+    source_root: Path,
+    pack_version: str,
+    callback: Optional[Callable[[float, str], None]] = None,
+) -> None:
     """
-    Method used to pack all the server files into a client archive.
+    Method used to pack server files into the server archive.
 
+    :param server_archive: the server archive, opened in write mode.
     :param server_paths: a list containing all the Path objects refering to the files needed server side.
+    :param source_root: the root folder of the files. Their path in the archive is relative to it.
     :param pack_version: the version of the pack.
     :param callback: Callable that takes a float and a string in parameters. (mainly the method to update the
             progress bar that takes a progress step per call and the label used to display infos to the user)
     :return: None
     """
+    if not server_paths:
+        return
 
     # computation of the progress per mod for the progressbar
     delta_progress = 100 / len(server_paths)
 
-    # remembering the cwd because it'll be changed during the zip operation
-    cwd = os.getcwd()
-    cache_dir = Path(ensure_cache_dir())
-    os.chdir(cache_dir)
-
-    # archive name
-    archive_name = f"server-{pack_version}.zip"
-
-    # deleting any previous client archive
-    if os.path.exists(archive_name):
-        os.remove(archive_name)
-        log.info("previous server archive deleted")
-
-    log.info("zipping client archive")
     # zipping the files in the archive
-    with ZipFile(archive_name, "w") as server_archive:
-        for mod_path in server_paths:
-            if callback is not None:
-                callback(delta_progress, f"Packing server archive version {pack_version}: {mod_path.name}. Progress: {{0}}%")
-
-            # writing the file in the zip
-            server_archive.write(mod_path, mod_path.relative_to(cache_dir / "server_archive"))
-
-    log.info("success!")
+    for mod_path in server_paths:
+        if callback is not None:
+            callback(delta_progress, f"Packing server archive version {pack_version}: {mod_path.name}. Progress: {{0}}%")
 
-    # restoring the cwd
-    os.chdir(cwd)
+        # writing the file in the zip
+        server_archive.write(mod_path, mod_path.relative_to(source_root), compress_type=get_compress_type(mod_path))
 
 
 def download_pack_archive() -> Path:
@@ -177,81 +246,118 @@ def download_pack_archive() -> Path:
         cache_dir = ensure_cache_dir()
         gtnh_archive_path = cache_dir / asset.name
 
-        if os.path.exists(gtnh_archive_path):
+        # size of what was already downloaded, a partial file being left behind by an interrupted download
+        downloaded_size = os.path.getsize(gtnh_archive_path) if os.path.exists(gtnh_archive_path) else 0
+
+        if downloaded_size == asset.size:
             log.info(f"Skipping re-redownload of {asset.name}")
             continue
 
-        log.info(f"Downloading {asset.name} to {gtnh_archive_path}")
-
         headers = {"Authorization": f"token {get_token()}", "Accept": "application/octet-stream"}
 
-        with requests.get(asset.url, stream=True, headers=headers) as r:
+        # resuming the partial download where it stopped
+        if 0 < downloaded_size < asset.size:
+            log.info(f"Resuming the download of {asset.name} to {gtnh_archive_path} at {downloaded_size} bytes")
+            headers["Range"] = f"bytes={downloaded_size}-"
+        else:
+            log.info(f"Downloading {asset.name} to {gtnh_archive_path}")
+
+        with get_session().get(asset.url, stream=True, headers=headers) as r:
             r.raise_for_status()
-            with open(gtnh_archive_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
+
+            # the file is written from scratch if the server sent the whole file instead of the requested range
+            with open(gtnh_archive_path, "ab" if r.status_code == 206 else "wb") as f:
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
         log.info("Download successful")
     return gtnh_archive_path
 
 
-def move_file_to_folder(path_list: List[Path], source_root: Path, destination_root: Path) -> None:
+def get_entry_key(name: str) -> str:
     """
-    Function used to move files from the source folder to the destination folder, while keeping the relative path.
+    Function used to normalize a path in the gtnh modpack archive, so the archive entries and the exclusions of the
+    manifest can be compared as strings whatever the separators or redundant parts they use. The case is also
+    normalized on platforms with case insensitive paths.
 
-    :param path_list: the list of files to move.
-    :param source_root: the root folder of the files to move. It is assumed that path_list has files comming from the
-                        same root folder.
-    :param destination_root: the root folder for the destination.
-    :return: None
+    :param name: the path of the file, relative to the root of the archive.
+    :return: the normalized path.
     """
-    for file in path_list:
-        dst = destination_root / file.relative_to(source_root)
-        if not dst.parent.is_dir():
-            os.makedirs(dst.parent)
-        copy(file, dst)
+    return os.path.normcase(posixpath.normpath(name.replace("\\", "/")))
 
 
-def crawl(path: Path) -> List[Path]:
+def get_entry_info(info: ZipInfo) -> ZipInfo:
     """
-    Function that will recursively list all the files of a folder.
+    Function used to make the ZipInfo of a file of the gtnh modpack archive for the client and server archives. A new
+    ZipInfo is needed for each archive, as the archive writing it fills in its offset and sizes.
 
-    :param path: The folder to scan
-    :return: The list of all the files contained in that folder
+    :param info: the ZipInfo of the file in the gtnh modpack archive.
+    :return: the ZipInfo to write the file with.
     """
-    files = [x for x in path.iterdir() if x.is_file()]
-    for folder in [x for x in path.iterdir() if x.is_dir()]:
-        files.extend(crawl(folder))
-    return files
+    zinfo = ZipInfo(info.filename, info.date_time)
+    zinfo.external_attr = info.external_attr
+    zinfo.compress_type = get_compress_type(Path(info.filename))
+
+    # the level is read from the ZipInfo by both writestr and open, so the streamed files get it as well
+    if sys.version_info >= (3, 13):
+        zinfo.compress_level = COMPRESS_LEVEL
+    else:
+        zinfo._compresslevel = COMPRESS_LEVEL  # type: ignore[attr-defined]
+
+    # lets the archive know upfront when the entry needs zip64
+    zinfo.file_size = info.file_size
+
+    return zinfo
 
 
-def move_mods(client_paths: List[Path], server_paths: List[Path]) -> None:
+def write_entries(archive: ZipFile, entries: "Queue[Optional[Tuple[ZipInfo, bytes]]]") -> None:
     """
-    Method used to move the mods in their correct archive folder after they have been downloaded.
+    Function run by the writer thread of an archive. It writes the chunks put in the queue until None is put in it,
+    each chunk coming with the ZipInfo of its file in the gtnh modpack archive. The chunks of a file are put one after
+    the other, and the archive must not be used by another thread meanwhile.
 
-    :param client_paths: the paths for the mods clientside
-    :param server_paths: the paths for the mods serverside
+    :param archive: the archive to write the files to, opened in write mode.
+    :param entries: the queue of the chunks to write.
     :return: None
     """
-    client_folder = Path(__file__).parent / "cache" / "client_archive"
-    server_folder = Path(__file__).parent / "cache" / "server_archive"
-    source_root = Path(__file__).parent / "cache"
+    current_info: Optional[ZipInfo] = None
+    dst: Optional[IO[bytes]] = None
+    try:
+        while True:
+            entry = entries.get()
+            if entry is None:
+                break
+
+            # a new file starts with its first chunk
+            info, chunk = entry
+            if dst is None or info is not current_info:
+                if dst is not None:
+                    dst.close()
 
-    if client_folder.exists():
-        rmtree(client_folder)
-        os.makedirs(client_folder)
+                current_info = info
+                dst = archive.open(get_entry_info(info), "w")
 
-    if server_folder.exists():
-        rmtree(server_folder)
-        os.makedirs(server_folder)
+            dst.write(chunk)
 
-    move_file_to_folder(client_paths, source_root, client_folder)
-    move_file_to_folder(server_paths, source_root, server_folder)
+    finally:
+        if dst is not None:
+            dst.close()
 
 
-def handle_pack_extra_files() -> None:
+def handle_pack_extra_files(
+    gtnh_metadata: GTNHModpack,
+    client_archive: ZipFile,
+    server_archive: ZipFile,
+    callback: Optional[Callable[[float, str], None]] = None,
+) -> None:
     """
-    Method used to handle all the files needed by the pack like the configs or the scripts.
+    Method used to handle all the files needed by the pack like the configs or the scripts. The files are copied from
+    the gtnh modpack archive straight into the client and server archives.
 
+    :param gtnh_metadata: GTNHModpack object. Represents the metadata of the modpack.
+    :param client_archive: the client archive, opened in write mode.
+    :param server_archive: the server archive, opened in write mode.
+    :param callback: Callable that takes a float and a string in parameters. (mainly the method to update the
+            progress bar that takes a progress step per call and the label used to display infos to the user)
     :return: None
     """
 
@@ -263,38 +369,90 @@ def handle_pack_extra_files() -> None:
         showerror("release not found", "The gtnh modpack repo has no release. Aborting.")
         raise PackingInterruptException
 
-    # prepare for the temp dir receiving the unzip of the archive
-    temp_dir = Path(gtnh_archive_path.parent / "temp")
-    if temp_dir.exists():
-        rmtree(temp_dir)
-    os.makedirs(temp_dir, exist_ok=True)
+    # exclusion lists
+    client_exclusions = {get_entry_key(exclusion) for exclusion in gtnh_metadata.client_exclusions}
+    server_exclusions = {get_entry_key(exclusion) for exclusion in gtnh_metadata.server_exclusions}
 
-    # unzip
-    with ZipFile(gtnh_archive_path, "r") as zip_ref:
-        zip_ref.extractall(temp_dir)
-    log.info("unzipped the pack")
+    # each archive is written by its own thread, so both archives are deflated at the same time while this thread
+    # reads the gtnh modpack archive. The queues hold up to 32 chunks each
+    client_entries: "Queue[Optional[Tuple[ZipInfo, bytes]]]" = Queue(maxsize=32)
+    server_entries: "Queue[Optional[Tuple[ZipInfo, bytes]]]" = Queue(maxsize=32)
+    write_errors: List[Exception] = []
 
-    # load gtnh metadata
-    gtnh_metadata = load_gtnh_manifest()
+    def _write(archive: ZipFile, entries: "Queue[Optional[Tuple[ZipInfo, bytes]]]") -> None:
+        """
+        Method run by the writer threads. It never touches the widgets as tkinter isn't thread safe.
 
-    # path for the prepared archives
-    client_folder = Path(__file__).parent / "cache" / "client_archive"
-    server_folder = Path(__file__).parent / "cache" / "server_archive"
+        :param archive: the archive written by the thread, opened in write mode.
+        :param entries: the queue of the chunks to write.
+        :return: None
+        """
+        try:
+            write_entries(archive, entries)
+        except Exception as e:
+            write_errors.append(e)
+
+            # draining the queue up to None, so the reading never stays blocked on a full queue
+            while entries.get() is not None:
+                pass
+
+    writers = [
+        Thread(target=_write, args=(client_archive, client_entries), daemon=True),
+        Thread(target=_write, args=(server_archive, server_entries), daemon=True),
+    ]
+    for writer in writers:
+        writer.start()
+
+    try:
+        with ZipFile(gtnh_archive_path, "r") as pack_archive:
+            # listing of all the files for the archives
+            availiable_files = [info for info in pack_archive.infolist() if not info.is_dir()]
+            if not availiable_files:
+                return
+
+            # computation of the progress per file for the progressbar
+            delta_progress = 100 / len(availiable_files)
+
+            for info in availiable_files:
+                # no need to read the rest of the files once an archive failed
+                if write_errors:
+                    break
+
+                if callback is not None:
+                    callback(delta_progress, f"Packing extra files for version {gtnh_metadata.modpack_version}: {info.filename}. Progress: {{0}}%")
+
+                entry_key = get_entry_key(info.filename)
+                queues = []
+                if entry_key not in client_exclusions:
+                    queues.append(client_entries)
+                if entry_key not in server_exclusions:
+                    queues.append(server_entries)
+
+                if not queues:
+                    continue
+
+                # the file is read once, in chunks of COPY_CHUNK_SIZE bytes so big files aren't loaded in memory at once,
+                # and its chunks are passed to the archives needing it. Empty files still pass one empty chunk
+                with pack_archive.open(info) as src:
+                    chunk = src.read(COPY_CHUNK_SIZE)
+                    while True:
+                        for entries in queues:
+                            entries.put((info, chunk))
+
+                        chunk = src.read(COPY_CHUNK_SIZE)
+                        if not chunk:
+                            break
+
+    finally:
+        for entries in [client_entries, server_entries]:
+            entries.put(None)
+
+        for writer in writers:
+            writer.join()
+
+    if write_errors:
+        raise write_errors[0]
 
-    # exclusion lists
-    client_exclusions = [temp_dir / exclusion for exclusion in gtnh_metadata.client_exclusions]
-    server_exclusions = [temp_dir / exclusion for exclusion in gtnh_metadata.server_exclusions]
-
-    # listing of all the files for the archive
-    availiable_files = set(crawl(temp_dir))
-    client_files = list(availiable_files - set(client_exclusions))
-    server_files = list(availiable_files - set(server_exclusions))
-
-    # moving the files where they must go
-    log.info("moving files for the client archive")
-    move_file_to_folder(client_files, temp_dir, client_folder)
-    log.info("moving files for the server archive")
-    move_file_to_folder(server_files, temp_dir, server_folder)
     log.info("success")
 
 
@@ -413,18 +571,21 @@ class AddRepoPopup(tk.Toplevel):
         self.stringvar_name_repo = tk.StringVar(self)
         self.entry_name_repo = tk.Entry(self, textvariable=self.stringvar_name_repo, width=30)
         self.btn_validate = tk.Button(self, text="validate", command=self.validate)
+        self.label_status = tk.Label(self, text="")
 
         # grid manager
         self.label_name_repo.pack()
         self.entry_name_repo.pack()
         self.btn_validate.pack()
+        self.label_status.pack()
 
         # state control vars
         self.is_messagebox_open = False
 
     def validate(self) -> None:
         """
-        Method executed when self.btn_validate is pressed by the user.
+        Method executed when self.btn_validate is pressed by the user. The repository is checked in a separate thread,
+        so the window stays responsive while github answers.
 
         :return: None
         """
@@ -434,37 +595,62 @@ class AddRepoPopup(tk.Toplevel):
 
             # resolving the name from the widget
             name = self.stringvar_name_repo.get()
+            self.label_status["text"] = f"checking the repository {name} on github..."
 
+            Thread(target=self._check_repo, args=(name,), daemon=True).start()
+
+    def _check_repo(self, name: str) -> None:
+        """
+        Method run in a separate thread to check and add the repository. The widgets are only updated from the tkinter
+        thread, via self.after.
+
+        :param name: the name of the repository.
+        :return: None
+        """
+        try:
             # checking the repo on github
-            try:
-                new_repo = get_repo(name)
+            new_repo = get_repo(name)
+
+            # checking if the repo is already added
+            gtnh = load_gtnh_manifest()
 
-            # let the user know that the repository doesn't exist
-            except RepoNotFoundException:
-                showerror("repository not found", f"the repository {name} was not found on github.")
+            # let the user know that the repository is already added
+            if gtnh.has_github_mod(new_repo.name):
+                self.after(0, self._show_result, showwarning, "repository already added", f"the repository {name} is already added.")
 
+            # adding the repo
             else:
-                # checking if the repo is already added
-                gtnh = load_gtnh_manifest()
+                new_mod = new_mod_from_repo(new_repo)
+                gtnh.github_mods.append(new_mod)
+                sort_and_write_modpack(gtnh)
+                self.after(0, self._show_result, showinfo, "repository added successfully", f"the repo {name} was added successfully!")
 
-                # let the user know that the repository is already added
-                if gtnh.get_github_mod(new_repo.name):
-                    showwarning("repository already added", f"the repository {name} is already added.")
+        # let the user know that the repository doesn't exist
+        except RepoNotFoundException:
+            self.after(0, self._show_result, showerror, "repository not found", f"the repository {name} was not found on github.")
 
-                # adding the repo
-                else:
-                    try:
-                        new_mod = new_mod_from_repo(new_repo)
-                        gtnh.github_mods.append(new_mod)
-                        sort_and_write_modpack(gtnh)
-                        showinfo("repository added successfully", f"the repo {name} was added successfully!")
+        # let the user know that the repository has no release, therefore it won't be added to the list
+        except LatestReleaseNotFound:
+            self.after(0, self._show_result, showerror, "no release availiable on the repository", f"the repository {name} has no release, aborting")
 
-                    # let the user know that the repository has no release, therefore it won't be added to the list
-                    except LatestReleaseNotFound:
-                        showerror("no release availiable on the repository", f"the repository {name} has no release, aborting")
+        # any other error (github, network, writing the manifest) must still release the popup
+        except Exception as e:
+            self.after(0, self._show_result, showerror, "error while adding the repository", str(e))
 
-            # releasing the blocking
-            self.is_messagebox_open = False
+    def _show_result(self, messagebox: Callable[[str, str], Any], title: str, message: str) -> None:
+        """
+        Method used to let the user know the result of the check of the repository.
+
+        :param messagebox: the tkinter messagebox function to use.
+        :param title: the title of the messagebox.
+        :param message: the message of the messagebox.
+        :return: None
+        """
+        self.label_status["text"] = ""
+        messagebox(title, message)
+
+        # releasing the blocking
+        self.is_messagebox_open = False
 
 
 class ArchivePopup(tk.Toplevel):
@@ -490,6 +676,10 @@ class ArchivePopup(tk.Toplevel):
         self.progress_label.pack()
         self.btn_start.pack()
 
+        # state control vars
+        self.progress = 0.0
+        self.last_redraw = 0.0
+
     def start(self) -> None:
         """
         Method called when self.btn_start is pressed by the user. It starts the packaging process.
@@ -499,59 +689,154 @@ class ArchivePopup(tk.Toplevel):
         github = Github(get_token())
         organization = github.get_organization("GTNewHorizons")
         gtnh_modpack = load_gtnh_manifest()
-        client_folder = Path(__file__).parent / "cache" / "client_archive"
-        server_folder = Path(__file__).parent / "cache" / "server_archive"
+        pack_version = gtnh_modpack.modpack_version
+
+        client_archive_name = f"client-{pack_version}.zip"
+        server_archive_name = f"server-{pack_version}.zip"
+
+        # the window events are processed during the packing, so the packing mustn't be started again meanwhile
+        self.btn_start["state"] = "disabled"
 
         try:
-            client_paths, server_paths = self.download_mods_client(gtnh_modpack, github, organization)
-            move_mods(client_paths, server_paths)
-            handle_pack_extra_files()
-            self.pack_clientpack_client(crawl(client_folder), gtnh_modpack.modpack_version)
-            self.pack_serverpack_client(crawl(server_folder), gtnh_modpack.modpack_version)
+            # the archives are opened upfront so the mods can be packed while the others are still downloading
+            log.info("zipping client and server archives")
+            try:
+                with open_archive(client_archive_name) as client_archive, open_archive(server_archive_name) as server_archive:
+                    self.download_and_pack_mods_client(gtnh_modpack, github, organization, client_archive, server_archive)
+                    self.handle_pack_extra_files_client(gtnh_modpack, client_archive, server_archive)
+
+            # the archives are only published once everything is packed
+            except BaseException:
+                discard_archive(client_archive_name)
+                discard_archive(server_archive_name)
+                raise
+
+            publish_archive(client_archive_name)
+            publish_archive(server_archive_name)
+            log.info("success!")
+
             self.pack_technic()
             self.make_deploader_json()
             self.pack_curse()
         except PackingInterruptException:
             pass
 
+        finally:
+            if self.winfo_exists():
+                self.btn_start["state"] = "normal"
+
     def _progress_callback(self, delta_progress: float, label: str) -> None:
         # updating the progress bar
-        self.progress_bar["value"] += delta_progress
-        self.progress_bar["value"] = min(100.0, float(format(self.progress_bar["value"], ".2f")))
-        self.progress_label["text"] = label.format(self.progress_bar["value"])
-        self.update()
-
-    def download_mods_client(self, gtnh_modpack: GTNHModpack, github: Github, organization: Organization) -> Tuple[List[Path], List[Path]]:
+        self.progress = min(100.0, self.progress + delta_progress)
+        self.progress_bar["value"] = self.progress
+        self.progress_label["text"] = label.format(round(self.progress, 2))
+
+        # processing the window events at most REDRAW_RATE times per second, as it's the costly part of the update
+        now = time.monotonic()
+        if now - self.last_redraw > 1 / REDRAW_RATE:
+            self.last_redraw = now
+            self.update()
+
+    def download_and_pack_mods_client(
+        self, gtnh_modpack: GTNHModpack, github: Github, organization: Organization, client_archive: ZipFile, server_archive: ZipFile
+    ) -> None:
         """
-        client version of download_mods.
+        client version of download_mods. The mods are downloaded in a separate thread and each of them is packed in the
+        archives as soon as it is downloaded.
 
         :param gtnh_modpack: GTNHModpack object. Represents the metadata of the modpack.
         :param github: Github object.
         :param organization: Organization object. Represent the GTNH organization.
-        :return: a list holding all the paths to the clientside mods and a list holding all the paths to the serverside
-                mod.
+        :param client_archive: the client archive, opened in write mode.
+        :param server_archive: the server archive, opened in write mode.
+        :return: None
         """
-        return download_mods(gtnh_modpack, github, organization, self._progress_callback)
+        cache_dir = ensure_cache_dir()
+        pack_version = gtnh_modpack.modpack_version
 
-    def pack_clientpack_client(self, client_paths: List[Path], pack_version: str) -> None:
-        """
-        Client version of pack_clientpack.
+        # computation of the progress per mod for the progressbar
+        delta_progress = 100 / len(gtnh_modpack.github_mods)
 
-        :param client_paths: a list containing all the Path objects refering to the files needed client side.
-        :param pack_version: the pack version.
-        :return: None
-        """
-        pack_clientpack(client_paths, pack_version, self._progress_callback)
+        # queue passing the downloaded mods to this thread. None is put in it when all the downloads are done
+        downloaded_mods: "Queue[Optional[Tuple[ModInfo, List[Path]]]]" = Queue(maxsize=32)
+        download_errors: List[Exception] = []
+
+        # set when the packing fails, to stop the downloader thread instead of letting it download the whole pack
+        packing_failed = Event()
 
-    def pack_serverpack_client(self, server_paths: List[Path], pack_version: str) -> None:
+        def _on_download(mod: ModInfo, paths: List[Path]) -> None:
+            """
+            Method called by the downloader thread with each downloaded mod, to pass it to this thread.
+
+            :param mod: the downloaded mod.
+            :param paths: the paths of the files of the mod.
+            :return: None
+            """
+            # raising aborts download_mods, which cancels the downloads not started yet
+            if packing_failed.is_set():
+                raise PackingInterruptException
+
+            downloaded_mods.put((mod, paths))
+
+        def _download() -> None:
+            """
+            Method run by the downloader thread. It never touches the widgets as tkinter isn't thread safe.
+
+            :return: None
+            """
+            try:
+                download_mods(gtnh_modpack, github, organization, on_download=_on_download)
+            except Exception as e:
+                download_errors.append(e)
+            finally:
+                downloaded_mods.put(None)
+
+        downloader = Thread(target=_download, daemon=True)
+        downloader.start()
+
+        # packing the mods as they land, the progress bar being updated from this thread
+        try:
+            while True:
+                # the window events are processed while waiting for the next mod, so the window doesn't freeze
+                try:
+                    downloaded_mod = downloaded_mods.get(timeout=1 / REDRAW_RATE)
+                except Empty:
+                    self.update()
+                    continue
+
+                if downloaded_mod is None:
+                    break
+
+                mod, paths = downloaded_mod
+                self._progress_callback(delta_progress, f"downloading and packing mods. current mod: {mod.name} Progress: {{0}}%")
+                if mod.side in ["BOTH", "CLIENT"]:
+                    pack_clientpack(client_archive, paths, cache_dir, pack_version)
+                if mod.side in ["BOTH", "SERVER"]:
+                    pack_serverpack(server_archive, paths, cache_dir, pack_version)
+
+        # stopping the downloader thread, the queue being drained up to None so it never stays blocked on a full queue
+        except BaseException:
+            packing_failed.set()
+            while downloaded_mods.get() is not None:
+                pass
+            raise
+
+        finally:
+            downloader.join()
+
+        if download_errors:
+            raise download_errors[0]
+
+    def handle_pack_extra_files_client(self, gtnh_modpack: GTNHModpack, client_archive: ZipFile, server_archive: ZipFile) -> None:
         """
-        Client version of pack_serverpack
+        Client version of handle_pack_extra_files.
 
-        :param server_paths: a list containing all the Path objects refering to the files needed server side.
-        :param pack_version: the pack version.
+        :param gtnh_modpack: GTNHModpack object. Represents the metadata of the modpack.
+        :param client_archive: the client archive, opened in write mode.
+        :param server_archive: the server archive, opened in write mode.
         :return: None
         """
-        pack_serverpack(server_paths, pack_version, self._progress_callback)
+        handle_pack_extra_files(gtnh_modpack, client_archive, server_archive, self._progress_callback)
 
     def make_deploader_json(self) -> None:
         """
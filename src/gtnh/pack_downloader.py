@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import cache
 from pathlib import Path
 from typing import List
 
@@ -9,12 +10,18 @@ import requests
 from github import Github
 from github.GitRelease import GitRelease
 from github.Organization import Organization
+from requests.adapters import HTTPAdapter
 from retry import retry
+from urllib3.util.retry import Retry
 
 from gtnh.mod_info import GTNHModpack, ModInfo
 from gtnh.utils import get_token, load_gtnh_manifest
 
 CACHE_DIR = "cache"
+# size in bytes of the chunks streamed to disk when downloading release assets
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# number of connections kept alive per host for the downloads
+MAX_CONNECTIONS = 16
 
 log = logging.getLogger("pack_donwloader")
 log.setLevel(logging.WARNING)
@@ -60,16 +67,26 @@ def download_mod(g: Github, o: Organization, mod: ModInfo) -> List[Path]:
         if repo.private:
             log.info("Private Repo!")
 
-        with requests.get(asset.url, stream=True, headers=headers) as r:
+        with get_session().get(asset.url, stream=True, headers=headers) as r:
             r.raise_for_status()
             with open(mod_filename, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
         log.info("Download successful")
         paths.append(mod_filename)
     return paths
 
 
+# shared by all the downloads, so the connections are pooled and kept alive instead of being reopened for each asset
+@cache
+def get_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_CONNECTIONS, pool_maxsize=MAX_CONNECTIONS, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("https://", adapter)
+
+    return session
+
+
 def ensure_cache_dir() -> Path:
     cache_dir = Path(os.getcwd()) / CACHE_DIR
     os.makedirs(cache_dir / "mods", exist_ok=True)